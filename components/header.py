@@ -1,12 +1,15 @@
 from playwright.sync_api import Page
+from utilities.visual_comparator import VisualComparator
 
 
 class Header:
     """Header component - appears on all authenticated pages."""
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, visual_comparator: VisualComparator = None):
         self._page = page
+        self._visual_comparator = visual_comparator
 
+        self.primary_header = page.get_by_test_id("primary-header")
         self.logo = page.get_by_text("Swag Labs")
         self.page_title = page.get_by_test_id("title")
         self.shopping_cart_button = page.get_by_test_id("shopping-cart-link")
@@ -30,4 +33,11 @@ class Header:
         # Check if badge exists first to avoid timeout if cart is empty
         if self.shopping_cart_badge.is_visible():
             return int(self.shopping_cart_badge.text_content())
-        return 0
\ No newline at end of file
+        return 0
+
+    def assert_visual_match(self, name: str = "header", mask: list = None, **thresholds):
+        """Assert header area matches its visual baseline (cart badge masked by default)."""
+        if self._visual_comparator is None:
+            raise RuntimeError("Header was created without a visual comparator")
+        mask = [self.shopping_cart_badge] if mask is None else mask
+        self._visual_comparator.assert_match(self.primary_header, name, mask=mask, **thresholds)
@@ -6,13 +6,58 @@ from pathlib import Path
 from factories.pages import PageFactory
 from logger import LoggerFactory
 from support.environment import Environment
+from support.browser_watchdog import BrowserMemoryWatchdog
+from support.selector_profiler import SelectorProfiler
+from utilities.visual_comparator import VisualComparator
 
 
 PROJECT_ROOT = Path(__file__).parent.resolve()
+# nodeid -> teardown user_properties (browser memory), read when pytest-html renders result rows
+browser_memory_by_test = {}
 
 def pytest_addoption(parser):
-    """Add custom CLI options (only --env, pytest-playwright handles browser)."""
+    """Add custom CLI options (pytest-playwright handles --browser and friends)."""
     parser.addoption("--env", action="store", default=None, help="Environment [qa, ci, dev, production, www]")
+    parser.addoption("--update-baselines", action="store_true", default=False,
+                     help="Overwrite visual baselines with current screenshots")
+    parser.addoption("--profile-selectors", action="store_true", default=False,
+                     help="Profile page-object locators and print a ranked cost report")
+    parser.addoption("--selector-slow-ms", action="store", type=float, default=50,
+                     help="Flag selectors whose resolution + actionability cost exceeds this (ms)")
+    parser.addoption("--browser-memory-limit-mb", action="store", type=float, default=0,
+                     help="Recycle a worker's browser between tests once its memory (summed PSS on Linux, "
+                          "USS elsewhere) exceeds this (0 = no limit)")
+    parser.addoption("--browser-max-tests", action="store", type=int, default=0,
+                     help="Recycle a worker's browser after this many tests (0 = no limit)")
+
+
+def pytest_configure(config):
+    # Controller only - xdist workers must not delete each other's reports
+    if hasattr(config, "workerinput"):
+        return
+    BrowserMemoryWatchdog.clear_reports(PROJECT_ROOT / "reports")
+    if config.getoption("--profile-selectors"):
+        SelectorProfiler.clear_reports(PROJECT_ROOT / "reports")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput"):
+        return
+
+    memory_lines = BrowserMemoryWatchdog.format_report(PROJECT_ROOT / "reports")
+    if memory_lines:
+        terminalreporter.section("browser memory (largest growth first)")
+        for line in memory_lines:
+            terminalreporter.write_line(line)
+
+    if not config.getoption("--profile-selectors"):
+        return
+    ranked = SelectorProfiler.load_reports(PROJECT_ROOT / "reports")
+    if not ranked:
+        return
+    terminalreporter.section("selector profile (slowest first)")
+    for line in SelectorProfiler.format_report(ranked, config.getoption("--selector-slow-ms")):
+        terminalreporter.write_line(line)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -49,6 +94,40 @@ def browser_type_launch_args(browser_type_launch_args):
     }
 
 
+@pytest.fixture(scope="session")
+def browser_watchdog(request, launch_browser, connect_options, logger):
+    """Session-scoped owner of the worker's browser - recycles it when memory limits are hit."""
+    if connect_options:
+        logger.warning("Browser memory watchdog: remote browser (connect_options) processes are not local - "
+                       "memory samples will be 0 and --browser-memory-limit-mb never triggers a recycle")
+    watchdog = BrowserMemoryWatchdog(
+        launch_browser,
+        report_dir=PROJECT_ROOT / "reports",
+        memory_limit_mb=request.config.getoption("--browser-memory-limit-mb"),
+        max_tests_per_browser=request.config.getoption("--browser-max-tests"),
+    )
+    yield watchdog
+    watchdog.close()
+    watchdog.write_report()
+
+
+@pytest.fixture
+def browser(request, browser_watchdog, logger):
+    """
+    Override pytest-playwright's session browser with a per-test handle from the watchdog.
+    Same browser is reused between tests until the watchdog recycles it.
+    Teardown runs after pytest-playwright closes the test's contexts, so growth reflects leaks.
+    """
+    browser = browser_watchdog.acquire()
+    memory_before_mb = browser_watchdog.sample_mb()
+    yield browser
+    sample = browser_watchdog.finish_test(request.node.nodeid, memory_before_mb)
+    request.node.user_properties.append(("browser_memory_mb", sample.memory_after_mb))
+    request.node.user_properties.append(("browser_memory_growth_mb", sample.growth_mb))
+    if sample.recycled:
+        logger.warning(f"Browser recycled after {request.node.name} ({sample.memory_after_mb} MB)")
+
+
 @pytest.fixture(scope="session")
 def browser_context_args(browser_context_args):
     """
@@ -67,13 +146,41 @@ def auth_state_cache():
     return {}
 
 
+@pytest.fixture(scope="session")
+def visual_comparator(request, browser_name):
+    """Session-scoped visual comparator - baselines are kept per browser."""
+    comparator = VisualComparator(
+        baseline_dir=PROJECT_ROOT / "visual_baselines" / browser_name,
+        diff_dir=PROJECT_ROOT / "reports" / "visual-diffs" / browser_name,
+        update_baselines=request.config.getoption("--update-baselines"),
+    )
+    yield comparator
+    comparator.save_index()
+
+
+@pytest.fixture(scope="session")
+def selector_profiler(request):
+    """Session-scoped selector profiler (None unless --profile-selectors is passed)."""
+    if not request.config.getoption("--profile-selectors"):
+        yield None
+        return
+    profiler = SelectorProfiler(
+        report_dir=PROJECT_ROOT / "reports",
+        slow_ms=request.config.getoption("--selector-slow-ms"),
+    )
+    yield profiler
+    profiler.write_report()
+
+
 @pytest.fixture
-def pages(page, env, auth_state_cache):
+def pages(page, env, auth_state_cache, visual_comparator, selector_profiler):
     """
     Main fixture - tests only need this.
     Uses pytest-playwright's page fixture under the hood.
     """
-    return PageFactory(page, env, auth_state_cache)
+    if selector_profiler:
+        selector_profiler.start_test()
+    return PageFactory(page, env, auth_state_cache, visual_comparator, selector_profiler)
 
 
 @pytest.fixture(scope="session")
@@ -101,6 +208,24 @@ def log_test_execution(request, logger):
     logger.info(f"*** TEST {test_name} ENDED")
 
 
+def pytest_runtest_logreport(report):
+    # Browser memory is sampled in the browser fixture teardown, so only the teardown report carries it.
+    # Runs on the controller (also under xdist) before pytest-html builds the row for this test.
+    if report.when == "teardown":
+        browser_memory_by_test[report.nodeid] = dict(report.user_properties)
+
+
+def pytest_html_results_table_header(cells):
+    cells.insert(3, "<th>Browser MB</th>")
+    cells.insert(4, "<th>Browser growth MB</th>")
+
+
+def pytest_html_results_table_row(report, cells):
+    memory = browser_memory_by_test.get(report.nodeid, {})
+    cells.insert(3, f'<td>{memory.get("browser_memory_mb", "")}</td>')
+    cells.insert(4, f'<td>{memory.get("browser_memory_growth_mb", "")}</td>')
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item):
     pytest_html = item.config.pluginmanager.getplugin('html')
@@ -3,14 +3,19 @@ from support.environment import Environment
 from utilities.auth_helper import AuthHelper
 from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
+from support.selector_profiler import SelectorProfiler
+from utilities.visual_comparator import VisualComparator
 
 
 class PageFactory:
     """Factory for lazy-loading page objects."""
 
-    def __init__(self, page: Page, env: Environment, auth_cookies_cache: dict):
+    def __init__(self, page: Page, env: Environment, auth_cookies_cache: dict,
+                 visual_comparator: VisualComparator = None, selector_profiler: SelectorProfiler = None):
         self._page = page
         self._env = env
+        self._visual_comparator = visual_comparator
+        self._selector_profiler = selector_profiler
         self._pages_cache = {}
         self._auth_cookies_cache = auth_cookies_cache
         self.auth_helper = AuthHelper(page, env, auth_cookies_cache)
@@ -25,16 +30,22 @@ class PageFactory:
         """
         self.auth_helper.auth_with_cookie(user)
 
+    def _profiled(self, page_object):
+        """Wrap page object with selector profiler when profiling is enabled."""
+        if self._selector_profiler is None:
+            return page_object
+        return self._selector_profiler.wrap(page_object)
+
     @property
     def login(self) -> LoginPage:
         """Get or create LoginPage instance."""
         if 'login' not in self._pages_cache:
-            self._pages_cache['login'] = LoginPage(self._page, self._env)
-        return self._pages_cache['login']
+            self._pages_cache['login'] = LoginPage(self._page, self._env, self._visual_comparator)
+        return self._profiled(self._pages_cache['login'])
 
     @property
     def inventory(self) -> InventoryPage:
         """Get or create InventoryPage instance."""
         if 'inventory' not in self._pages_cache:
-            self._pages_cache['inventory'] = InventoryPage(self._page, self._env)
-        return self._pages_cache['inventory']
\ No newline at end of file
+            self._pages_cache['inventory'] = InventoryPage(self._page, self._env, self._visual_comparator)
+        return self._profiled(self._pages_cache['inventory'])
\ No newline at end of file
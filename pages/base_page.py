@@ -1,5 +1,6 @@
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Locator, Page, expect
 from support.environment import Environment
+from utilities.visual_comparator import VisualComparator
 import re
 
 
@@ -8,10 +9,14 @@ class BasePage:
 
     PATH = "/"
     TITLE = None
+    # Locator attribute/method name -> expected match count (None = collection, any count).
+    # Anything not listed is expected to match a single element (used by --profile-selectors).
+    EXPECTED_MATCHES = {}
 
-    def __init__(self, page: Page, env: Environment):
+    def __init__(self, page: Page, env: Environment, visual_comparator: VisualComparator = None):
         self._page = page
         self._env = env
+        self._visual_comparator = visual_comparator
 
     def navigate(self, path: str = None, verify_on_page: bool = True):
         """Navigate to page with optional validation."""
@@ -41,4 +46,17 @@ class BasePage:
 
     def get_page_source_code(self) -> str:
         """Get page HTML source."""
-        return self._page.content()
\ No newline at end of file
+        return self._page.content()
+
+    def assert_visual_match(self, name: str, mask: list[Locator] = None, **thresholds):
+        """
+        Assert current viewport matches stored visual baseline.
+
+        Args:
+            name: Baseline name (e.g. 'inventory-page')
+            mask: Locators to hide before screenshot (dynamic content)
+            **thresholds: pixel_threshold / max_diff_ratio / mask_regions overrides
+        """
+        if self._visual_comparator is None:
+            raise RuntimeError(f"{type(self).__name__} was created without a visual comparator")
+        self._visual_comparator.assert_match(self._page, name, mask=mask, **thresholds)
@@ -8,9 +8,20 @@ class InventoryPage(BasePage):
 
     PATH = "/inventory.html"
     TITLE = "Products"
-
-    def __init__(self, page, env):
-        super().__init__(page, env)
+    EXPECTED_MATCHES = {
+        "inventory_items": None,
+        "inventory_item_names": None,
+        "inventory_item_prices": None,
+        "item_name": None,
+        "item_desc": None,
+        "item_price": None,
+        "item_img": None,
+        "add_to_cart_btn": None,
+        "remove_btn": None,
+    }
+
+    def __init__(self, page, env, visual_comparator=None):
+        super().__init__(page, env, visual_comparator)
 
         # Page elements
         self.inventory_items = page.get_by_test_id("inventory-item")
@@ -26,7 +37,7 @@ class InventoryPage(BasePage):
         self.remove_btn = page.get_by_role("button", name="Remove")  # Add this line
 
         self.sort_dropdown = page.get_by_test_id("product_sort_container")
-        self.header = Header(page)
+        self.header = Header(page, visual_comparator)
         self.sidebar = SidebarMenu(page)
 
     def get_product_count(self) -> int:
@@ -42,6 +53,19 @@ class InventoryPage(BasePage):
             has=self.item_name.get_by_text(product_name, exact=True)
         )
 
+    def assert_product_card_visual_match(self, product_name: str, mask: list = None, **thresholds):
+        """Assert a single product card matches its visual baseline (named after the product)."""
+        if self._visual_comparator is None:
+            raise RuntimeError("InventoryPage was created without a visual comparator")
+        card = self.get_product_card(product_name)
+        self._visual_comparator.assert_match(card, self.product_card_baseline_name(product_name),
+                                             mask=mask, **thresholds)
+
+    @staticmethod
+    def product_card_baseline_name(product_name: str) -> str:
+        """Visual baseline name of a product card."""
+        return f"product-card/{product_name.lower().replace(' ', '-')}"
+
     def get_product_container_by_name(self, product_name: str):
         """Get product container by product name."""
         return self._page.locator(f'[data-test="inventory-item"]:has-text("{product_name}")')
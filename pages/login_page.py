@@ -7,8 +7,8 @@ class LoginPage(BasePage):
     PATH = "/"
     TITLE = None
 
-    def __init__(self, page, env):
-        super().__init__(page, env)
+    def __init__(self, page, env, visual_comparator=None):
+        super().__init__(page, env, visual_comparator)
 
         # Locators as attributes - direct, native, clear
         self.username_input = page.get_by_test_id("username")
@@ -0,0 +1,155 @@
+import os
+import json
+import psutil
+from pathlib import Path
+from typing import Callable
+from dataclasses import dataclass, asdict
+from playwright.sync_api import Browser
+
+
+@dataclass
+class MemorySample:
+    """Browser memory around a single test (MB, summed PSS/USS of browser + renderer processes)."""
+
+    nodeid: str
+    memory_before_mb: float
+    memory_after_mb: float
+    growth_mb: float
+    recycled: bool = False
+
+
+class BrowserMemoryWatchdog:
+    """
+    Own the worker's browser and recycle it when it grows too large.
+
+    Replaces pytest-playwright's session-long browser: the browser is still shared between tests,
+    but after each test its process tree memory is sampled and, once a limit is reached,
+    the browser is closed at the test boundary and relaunched lazily for the next test.
+
+    Args:
+        launch_browser: pytest-playwright's launch_browser callable (keeps browser_type_launch_args)
+        report_dir: Directory for per-worker JSON reports
+        memory_limit_mb: Recycle when browser memory (summed PSS) exceeds this (0 = no limit)
+        max_tests_per_browser: Recycle after this many tests (0 = no limit)
+    """
+
+    REPORT_PREFIX = "browser-memory"
+
+    def __init__(self, launch_browser: Callable[[], Browser], report_dir: Path,
+                 memory_limit_mb: float = 0, max_tests_per_browser: int = 0):
+        self._launch_browser = launch_browser
+        self.report_dir = Path(report_dir)
+        self.memory_limit_mb = memory_limit_mb
+        self.max_tests_per_browser = max_tests_per_browser
+
+        self._browser = None
+        self._tests_on_browser = 0
+        self.recycle_count = 0
+        self.samples: list[MemorySample] = []
+
+    def acquire(self) -> Browser:
+        """Get the current browser, launching a new one after a recycle."""
+        if self._browser is None or not self._browser.is_connected():
+            self._browser = self._launch_browser()
+            self._tests_on_browser = 0
+        self._tests_on_browser += 1
+        return self._browser
+
+    def sample_mb(self) -> float:
+        """
+        Memory of this worker's browser processes.
+
+        Browsers are children of the Playwright driver, which is a child of this (worker) process,
+        so parallel workers never count each other's browsers.
+        Chromium processes share most of their pages, so summed RSS would count them many times over.
+        PSS (Linux) splits shared pages between processes, so the sum is the real footprint;
+        other platforms fall back to USS (private memory only - slightly under the real figure).
+        """
+        total_bytes = 0
+        for driver in psutil.Process().children():
+            try:
+                browser_processes = driver.children(recursive=True)
+            except psutil.NoSuchProcess:
+                continue
+            for process in browser_processes:
+                try:
+                    memory = process.memory_full_info()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    # Renderers come and go between listing and sampling
+                    continue
+                total_bytes += getattr(memory, "pss", memory.uss)
+        return total_bytes / (1024 * 1024)
+
+    def finish_test(self, nodeid: str, memory_before_mb: float) -> MemorySample:
+        """Sample memory after a test and recycle the browser if a limit is reached."""
+        memory_after_mb = self.sample_mb()
+        recycled = self._should_recycle(memory_after_mb)
+        if recycled:
+            self.recycle()
+
+        sample = MemorySample(
+            nodeid=nodeid,
+            memory_before_mb=round(memory_before_mb, 1),
+            memory_after_mb=round(memory_after_mb, 1),
+            growth_mb=round(memory_after_mb - memory_before_mb, 1),
+            recycled=recycled,
+        )
+        self.samples.append(sample)
+        return sample
+
+    def _should_recycle(self, memory_mb: float) -> bool:
+        if self.memory_limit_mb and memory_mb > self.memory_limit_mb:
+            return True
+        return bool(self.max_tests_per_browser) and self._tests_on_browser >= self.max_tests_per_browser
+
+    def recycle(self):
+        """Close current browser; next acquire() launches a fresh one."""
+        self.close()
+        self.recycle_count += 1
+
+    def close(self):
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+
+    def write_report(self):
+        """Write this worker's samples to JSON (merged later by the controller)."""
+        if not self.samples:
+            return
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'master')
+        report_path = self.report_dir / f"{self.REPORT_PREFIX}-{worker_id}.json"
+        with open(report_path, 'w') as f:
+            json.dump({
+                "worker": worker_id,
+                "recycle_count": self.recycle_count,
+                "samples": [asdict(sample) for sample in self.samples],
+            }, f, indent=2)
+
+    @classmethod
+    def clear_reports(cls, report_dir: Path):
+        """Remove worker reports of previous runs."""
+        for report_path in Path(report_dir).glob(f"{cls.REPORT_PREFIX}-*.json"):
+            report_path.unlink()
+
+    @classmethod
+    def format_report(cls, report_dir: Path, limit: int = 10) -> list[str]:
+        """Per-worker peak/recycles plus the tests with the largest memory growth."""
+        lines = []
+        samples = []
+        for report_path in sorted(Path(report_dir).glob(f"{cls.REPORT_PREFIX}-*.json")):
+            with open(report_path, 'r') as f:
+                report = json.load(f)
+            worker_samples = [MemorySample(**sample) for sample in report["samples"]]
+            peak_mb = max(sample.memory_after_mb for sample in worker_samples)
+            lines.append(f"{report['worker']}: peak {peak_mb:.1f} MB, "
+                         f"{report['recycle_count']} recycle(s), {len(worker_samples)} test(s)")
+            samples.extend(worker_samples)
+
+        if not samples:
+            return []
+        lines.append(f"{'growth MB':>10} {'after MB':>10}  test")
+        for sample in sorted(samples, key=lambda sample: sample.growth_mb, reverse=True)[:limit]:
+            recycled = "  [recycled]" if sample.recycled else ""
+            lines.append(f"{sample.growth_mb:10.1f} {sample.memory_after_mb:10.1f}  {sample.nodeid}{recycled}")
+        return lines
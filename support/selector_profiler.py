@@ -0,0 +1,270 @@
+import os
+import json
+import time
+import statistics
+from functools import partial
+from pathlib import Path
+from dataclasses import dataclass, field, asdict
+from playwright.sync_api import Error as PlaywrightError, Locator
+
+
+# Side-effect-free version of Playwright's actionability checks, timed inside the page so neither
+# the round-trip nor the selector resolution is included: two animation frames for stability,
+# hit-testing the element centre for "receives events" (skipped when off-screen - we never scroll).
+ACTIONABILITY_SCRIPT = """async (element) => {
+    const start = performance.now();
+    const nextFrame = () => new Promise(resolve => requestAnimationFrame(resolve));
+    const before = element.getBoundingClientRect();
+    await nextFrame();
+    await nextFrame();
+    const after = element.getBoundingClientRect();
+    const stable = before.x === after.x && before.y === after.y
+        && before.width === after.width && before.height === after.height;
+    const x = after.left + after.width / 2;
+    const y = after.top + after.height / 2;
+    let receivesEvents = null;
+    if (x >= 0 && y >= 0 && x < window.innerWidth && y < window.innerHeight) {
+        const hit = document.elementFromPoint(x, y);
+        receivesEvents = !!hit && (hit === element || element.contains(hit));
+    }
+    const enabled = !element.disabled && element.getAttribute("aria-disabled") !== "true";
+    return {elapsed: performance.now() - start, stable, receivesEvents, enabled};
+}"""
+
+
+@dataclass
+class SelectorStats:
+    """Aggregated timings for one page-object locator attribute or method."""
+
+    label: str
+    expected_matches: int | None = 1
+    accesses: int = 0
+    call_ms: list[float] = field(default_factory=list)
+    resolve_ms: list[float] = field(default_factory=list)
+    actionable_ms: list[float] = field(default_factory=list)
+    match_counts: list[int] = field(default_factory=list)
+    unstable: int = 0
+    obscured: int = 0
+    disabled: int = 0
+
+    @property
+    def cost_ms(self) -> float:
+        """
+        Median selector resolution - the ranking key.
+        Actionability is reported separately: it is dominated by the two-frame stability wait,
+        which is the same for every selector and would drown out the resolution differences.
+        """
+        return statistics.median(self.resolve_ms) if self.resolve_ms else 0.0
+
+    @property
+    def max_matches(self) -> int:
+        return max(self.match_counts, default=0)
+
+    def flags(self, slow_ms: float) -> list[str]:
+        """Reasons this selector is worth rewriting."""
+        flags = []
+        if self.cost_ms > slow_ms:
+            flags.append("SLOW")
+        if self.expected_matches is not None and self.max_matches > self.expected_matches:
+            flags.append(f"MATCHES {self.max_matches}>{self.expected_matches}")
+        if self.unstable:
+            flags.append(f"UNSTABLE x{self.unstable}")
+        if self.obscured:
+            flags.append(f"OBSCURED x{self.obscured}")
+        if self.disabled:
+            flags.append(f"DISABLED x{self.disabled}")
+        return flags
+
+    def merge(self, other: "SelectorStats"):
+        self.accesses += other.accesses
+        self.call_ms += other.call_ms
+        self.resolve_ms += other.resolve_ms
+        self.actionable_ms += other.actionable_ms
+        self.match_counts += other.match_counts
+        self.unstable += other.unstable
+        self.obscured += other.obscured
+        self.disabled += other.disabled
+
+
+class SelectorProfiler:
+    """
+    Profile page-object locators while tests run.
+
+    Page objects returned by PageFactory are wrapped so every locator attribute access and
+    page-object method call is recorded. Each distinct locator is probed once per test and URL:
+        - resolution: time of locator.count() minus the page round-trip (selector match cost)
+        - actionability: in-page stability / hit-target / enabled checks on the first match
+    Probes are read-only: hidden or missing elements are skipped instead of waited for,
+    and nothing is scrolled or clicked, so profiling does not change page state mid-test.
+    Page-object methods run with the proxy as `self`, so locators used inside them are recorded too.
+    Locators matching more elements than the page object's EXPECTED_MATCHES (default 1) are flagged.
+
+    Args:
+        report_dir: Directory for per-worker JSON reports
+        slow_ms: Cost above which a selector is flagged as slow
+    """
+
+    REPORT_PREFIX = "selector-profile"
+
+    def __init__(self, report_dir: Path, slow_ms: float = 50):
+        self.report_dir = Path(report_dir)
+        self.slow_ms = slow_ms
+        self.stats: dict[str, SelectorStats] = {}
+        self._probed = set()
+
+    def start_test(self):
+        """Reset per-test probe cache so page state of each test is measured."""
+        self._probed.clear()
+
+    def wrap(self, page_object, label: str = None):
+        """Wrap a page object or component so its locators and methods are profiled."""
+        return ProfiledPageObject(page_object, self, label or type(page_object).__name__)
+
+    def _get_stats(self, label: str, expected_matches: int | None) -> SelectorStats:
+        if label not in self.stats:
+            self.stats[label] = SelectorStats(label=label, expected_matches=expected_matches)
+        return self.stats[label]
+
+    def record_access(self, label: str, locator: Locator, expected_matches: int | None, probe_key: str = ""):
+        """Record locator usage and probe it once per test/URL/arguments."""
+        stats = self._get_stats(label, expected_matches)
+        stats.accesses += 1
+
+        page = locator.page
+        key = (label, probe_key, page.url)
+        if key in self._probed:
+            return
+        self._probed.add(key)
+        self._probe(stats, locator)
+
+    def record_call(self, label: str, duration_ms: float, expected_matches: int | None):
+        self._get_stats(label, expected_matches).call_ms.append(duration_ms)
+
+    def _probe(self, stats: SelectorStats, locator: Locator):
+        """Measure selector cost without side effects (no scrolling, no clicking, no waiting)."""
+        page = locator.page
+        first = locator.first
+        try:
+            start = time.perf_counter()
+            page.evaluate("0")
+            round_trip_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            count = locator.count()
+            resolve_ms = max((time.perf_counter() - start) * 1000 - round_trip_ms, 0.0)
+
+            stats.match_counts.append(count)
+            stats.resolve_ms.append(resolve_ms)
+            # Hidden elements (e.g. closed sidebar) are not actionable yet - nothing to time
+            if count == 0 or not first.is_visible():
+                return
+
+            checks = first.evaluate(ACTIONABILITY_SCRIPT)
+        except PlaywrightError:
+            # Page navigated or closed mid-probe - nothing meaningful to record
+            return
+
+        stats.actionable_ms.append(checks["elapsed"])
+        stats.unstable += not checks["stable"]
+        stats.obscured += checks["receivesEvents"] is False
+        stats.disabled += not checks["enabled"]
+
+    def write_report(self):
+        """Write this worker's stats to JSON (merged later by the controller)."""
+        if not self.stats:
+            return
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'master')
+        report_path = self.report_dir / f"{self.REPORT_PREFIX}-{worker_id}.json"
+        with open(report_path, 'w') as f:
+            json.dump([asdict(stats) for stats in self.stats.values()], f, indent=2)
+
+    @classmethod
+    def clear_reports(cls, report_dir: Path):
+        """Remove worker reports of previous runs."""
+        for report_path in Path(report_dir).glob(f"{cls.REPORT_PREFIX}-*.json"):
+            report_path.unlink()
+
+    @classmethod
+    def load_reports(cls, report_dir: Path) -> list[SelectorStats]:
+        """Merge all worker reports, ranked by cost (most expensive first)."""
+        merged: dict[str, SelectorStats] = {}
+        for report_path in sorted(Path(report_dir).glob(f"{cls.REPORT_PREFIX}-*.json")):
+            with open(report_path, 'r') as f:
+                for entry in json.load(f):
+                    stats = SelectorStats(**entry)
+                    if stats.label in merged:
+                        merged[stats.label].merge(stats)
+                    else:
+                        merged[stats.label] = stats
+        return sorted(merged.values(), key=lambda stats: stats.cost_ms, reverse=True)
+
+    @staticmethod
+    def format_report(ranked: list[SelectorStats], slow_ms: float, limit: int = 20) -> list[str]:
+        """Ranked report lines for the terminal summary."""
+        lines = [f"{'resolve':>8} {'action':>8} {'call':>8} {'uses':>5} {'max#':>5}  selector"]
+        for stats in ranked[:limit]:
+            actionable = statistics.median(stats.actionable_ms) if stats.actionable_ms else 0.0
+            call = statistics.median(stats.call_ms) if stats.call_ms else 0.0
+            flags = stats.flags(slow_ms)
+            line = (f"{stats.cost_ms:8.1f} {actionable:8.1f} {call:8.1f} "
+                    f"{stats.accesses:5d} {stats.max_matches:5d}  {stats.label}")
+            if flags:
+                line += f"  [{', '.join(flags)}]"
+            lines.append(line)
+        return lines
+
+
+class ProfiledPageObject:
+    """
+    Transparent proxy recording locator attributes and method calls of a page object.
+    `__class__` is forwarded, so isinstance() checks against the page object class still hold.
+    """
+
+    def __init__(self, target, profiler: SelectorProfiler, label: str):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_profiler", profiler)
+        object.__setattr__(self, "_label", label)
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        label = f"{self._label}.{name}"
+        expected_matches = getattr(self._target, "EXPECTED_MATCHES", {}).get(name, 1)
+
+        if isinstance(value, Locator):
+            self._profiler.record_access(label, value, expected_matches)
+            return value
+        if _is_page_object(value):
+            return self._profiler.wrap(value, label)
+        if callable(value):
+            return self._wrap_method(label, value, expected_matches)
+        return value
+
+    def __setattr__(self, name, value):
+        setattr(self._target, name, value)
+
+    @property
+    def __class__(self):
+        return type(self._target)
+
+    def _wrap_method(self, label: str, method, expected_matches: int | None):
+        profiler = self._profiler
+        # Re-bind page-object methods to the proxy so `self.<locator>` / `self.<method>()` inside them
+        # is profiled too (staticmethods and other callables are called as they are)
+        if getattr(method, "__self__", None) is self._target:
+            method = partial(method.__func__, self)
+
+        def profiled(*args, **kwargs):
+            start = time.perf_counter()
+            result = method(*args, **kwargs)
+            profiler.record_call(label, (time.perf_counter() - start) * 1000, expected_matches)
+            if isinstance(result, Locator):
+                profiler.record_access(label, result, expected_matches, probe_key=repr((args, kwargs)))
+            return result
+
+        return profiled
+
+
+def _is_page_object(value) -> bool:
+    """Page objects and components live in the pages/ and components/ packages."""
+    return type(value).__module__.split(".")[0] in ("pages", "components")
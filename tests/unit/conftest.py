@@ -0,0 +1,6 @@
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def configure_playwright():
+    """Unit tests never touch a browser - skip starting the Playwright driver."""
@@ -0,0 +1,76 @@
+import pytest
+from support.browser_watchdog import BrowserMemoryWatchdog
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    def close(self):
+        self.closed = True
+
+
+def make_watchdog(tmp_path, monkeypatch, memory_mb=100.0, **limits):
+    launched = []
+
+    def launch_browser():
+        launched.append(FakeBrowser())
+        return launched[-1]
+
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    watchdog = BrowserMemoryWatchdog(launch_browser, report_dir=tmp_path, **limits)
+    monkeypatch.setattr(watchdog, "sample_mb", lambda: memory_mb)
+    return watchdog, launched
+
+
+@pytest.mark.unit
+class TestBrowserMemoryWatchdog:
+    """Test browser reuse, recycling limits and memory reports without a real browser."""
+
+    def test_browser_is_reused_without_limits(self, tmp_path, monkeypatch):
+        watchdog, launched = make_watchdog(tmp_path, monkeypatch)
+
+        for index in range(5):
+            watchdog.acquire()
+            assert not watchdog.finish_test(f"test_{index}", 90.0).recycled
+
+        assert len(launched) == 1
+
+    def test_recycles_after_max_tests(self, tmp_path, monkeypatch):
+        watchdog, launched = make_watchdog(tmp_path, monkeypatch, max_tests_per_browser=2)
+
+        recycled = []
+        for index in range(4):
+            watchdog.acquire()
+            recycled.append(watchdog.finish_test(f"test_{index}", 90.0).recycled)
+
+        assert recycled == [False, True, False, True]
+        assert len(launched) == 2
+        assert all(browser.closed for browser in launched)
+
+    def test_recycles_when_memory_limit_exceeded(self, tmp_path, monkeypatch):
+        watchdog, launched = make_watchdog(tmp_path, monkeypatch, memory_mb=600.0, memory_limit_mb=500)
+
+        watchdog.acquire()
+        sample = watchdog.finish_test("test_heavy", 450.0)
+
+        assert sample.recycled
+        assert sample.growth_mb == 150.0
+        assert launched[0].closed
+        assert watchdog.acquire() is launched[1]
+
+    def test_report_ranks_tests_by_growth(self, tmp_path, monkeypatch):
+        watchdog, _ = make_watchdog(tmp_path, monkeypatch, memory_mb=200.0)
+        for nodeid, memory_before_mb in (("test_small", 190.0), ("test_large", 120.0)):
+            watchdog.acquire()
+            watchdog.finish_test(nodeid, memory_before_mb)
+        watchdog.write_report()
+
+        lines = BrowserMemoryWatchdog.format_report(tmp_path)
+
+        assert lines[0] == "master: peak 200.0 MB, 0 recycle(s), 2 test(s)"
+        assert lines[2].endswith("test_large")
+        assert lines[3].endswith("test_small")
@@ -0,0 +1,226 @@
+import pytest
+from playwright.sync_api import Locator
+from components.header import Header
+from support.selector_profiler import SelectorProfiler, SelectorStats
+
+
+class FakePage:
+    """Minimal stand-in for a Playwright Page: builds fake locators, answers evaluate()."""
+
+    url = "https://www.saucedemo.com/inventory.html"
+
+    def __init__(self, matches: dict = None):
+        self.matches = matches or {}
+
+    def evaluate(self, expression):
+        return 0
+
+    def get_by_test_id(self, test_id):
+        return FakeLocator(self, test_id, self.matches.get(test_id, 1))
+
+    def get_by_text(self, text):
+        return FakeLocator(self, text, self.matches.get(text, 1))
+
+    def get_by_role(self, role, name=None):
+        return FakeLocator(self, name, self.matches.get(name, 1))
+
+
+class FakeLocator(Locator):
+    """Locator subclass (passes isinstance checks) that records calls instead of driving a browser."""
+
+    def __init__(self, page: FakePage, selector: str, count: int, visible: bool = True, **checks):
+        self._fake_page = page
+        self.selector = selector
+        self._count = count
+        self._visible = visible
+        self._checks = {"elapsed": 34.0, "stable": True, "receivesEvents": True, "enabled": True, **checks}
+        self.calls = []
+
+    @property
+    def page(self):
+        return self._fake_page
+
+    @property
+    def first(self):
+        return self
+
+    def count(self):
+        self.calls.append("count")
+        return self._count
+
+    def is_visible(self, **kwargs):
+        self.calls.append("is_visible")
+        return self._visible
+
+    def evaluate(self, expression, arg=None):
+        self.calls.append("evaluate")
+        return self._checks
+
+    def select_option(self, value):
+        self.calls.append("select_option")
+
+
+class FakeInventory:
+    """Page-object shaped class with a collection locator, a single locator and a locator method."""
+
+    EXPECTED_MATCHES = {"items": None}
+
+    def __init__(self, page: FakePage):
+        self.items = FakeLocator(page, "inventory-item", 6)
+        self.sort_dropdown = FakeLocator(page, "sort", 1)
+        self.title = "Products"
+
+    def get_product_card(self, product_name):
+        return FakeLocator(self.items.page, f"card:{product_name}", 2)
+
+    def get_product_count(self) -> int:
+        return self.items.count()
+
+    def choose_option(self, sort_by: str):
+        self.sort_dropdown.select_option(sort_by)
+
+    def get_product_title(self, product_name):
+        return self.get_product_card(product_name)
+
+    @staticmethod
+    def slug(product_name: str) -> str:
+        return product_name.lower().replace(" ", "-")
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    return SelectorProfiler(report_dir=tmp_path, slow_ms=50)
+
+
+@pytest.mark.unit
+class TestSelectorProfiler:
+    """Test page-object proxying, probing, flags and report merging with fake locators."""
+
+    def test_locator_attribute_is_recorded_and_returned_unchanged(self, profiler):
+        inventory = FakeInventory(FakePage())
+        profiled = profiler.wrap(inventory)
+
+        assert profiled.sort_dropdown is inventory.sort_dropdown
+        assert profiled.title == "Products"
+
+        stats = profiler.stats["FakeInventory.sort_dropdown"]
+        assert stats.accesses == 1
+        assert stats.match_counts == [1]
+        assert stats.actionable_ms == [34.0]
+
+    def test_locator_is_probed_once_per_test(self, profiler):
+        inventory = FakeInventory(FakePage())
+        profiled = profiler.wrap(inventory)
+
+        for _ in range(3):
+            profiled.sort_dropdown
+        assert profiler.stats["FakeInventory.sort_dropdown"].accesses == 3
+        assert inventory.sort_dropdown.calls.count("count") == 1
+
+        profiler.start_test()
+        profiled.sort_dropdown
+        assert inventory.sort_dropdown.calls.count("count") == 2
+
+    def test_probe_is_read_only(self, profiler):
+        inventory = FakeInventory(FakePage())
+        profiler.wrap(inventory).sort_dropdown
+
+        assert inventory.sort_dropdown.calls == ["count", "is_visible", "evaluate"]
+
+    def test_hidden_and_missing_locators_are_not_timed(self, profiler):
+        page = FakePage()
+        hidden = FakeLocator(page, "hidden", 1, visible=False)
+        missing = FakeLocator(page, "missing", 0)
+
+        profiler.record_access("Sidebar.logout_link", hidden, 1)
+        profiler.record_access("Header.shopping_cart_badge", missing, 1)
+
+        assert profiler.stats["Sidebar.logout_link"].actionable_ms == []
+        assert hidden.calls == ["count", "is_visible"]
+        assert missing.calls == ["count"]
+
+    def test_failed_actionability_checks_are_flagged(self, profiler):
+        page = FakePage()
+        profiler.record_access("Page.button", FakeLocator(page, "button", 1, enabled=False), 1)
+        profiler.record_access("Page.moving", FakeLocator(page, "moving", 1, stable=False), 1)
+        profiler.record_access("Page.covered", FakeLocator(page, "covered", 1, receivesEvents=False), 1)
+        profiler.record_access("Page.offscreen", FakeLocator(page, "offscreen", 1, receivesEvents=None), 1)
+
+        assert profiler.stats["Page.button"].flags(slow_ms=50) == ["DISABLED x1"]
+        assert profiler.stats["Page.moving"].flags(slow_ms=50) == ["UNSTABLE x1"]
+        assert profiler.stats["Page.covered"].flags(slow_ms=50) == ["OBSCURED x1"]
+        assert profiler.stats["Page.offscreen"].flags(slow_ms=50) == []
+
+    def test_locators_used_inside_methods_are_recorded(self, profiler):
+        inventory = FakeInventory(FakePage())
+        profiled = profiler.wrap(inventory)
+
+        profiled.choose_option("hilo")
+        assert profiled.get_product_count() == 6
+
+        assert inventory.sort_dropdown.calls == ["count", "is_visible", "evaluate", "select_option"]
+        assert profiler.stats["FakeInventory.sort_dropdown"].accesses == 1
+        assert profiler.stats["FakeInventory.items"].resolve_ms
+        assert len(profiler.stats["FakeInventory.choose_option"].call_ms) == 1
+
+    def test_helper_methods_called_inside_methods_are_recorded(self, profiler):
+        profiler.wrap(FakeInventory(FakePage())).get_product_title("Backpack")
+
+        assert profiler.stats["FakeInventory.get_product_card"].accesses == 1
+        assert profiler.stats["FakeInventory.get_product_title"].accesses == 1
+
+    def test_static_methods_are_called_unchanged(self, profiler):
+        assert profiler.wrap(FakeInventory(FakePage())).slug("Sauce Labs Backpack") == "sauce-labs-backpack"
+
+    def test_proxy_passes_isinstance_checks(self, profiler):
+        inventory = FakeInventory(FakePage())
+
+        assert isinstance(profiler.wrap(inventory), FakeInventory)
+        assert isinstance(profiler.wrap(Header(FakePage())), Header)
+
+    def test_method_result_is_probed_per_arguments(self, profiler):
+        profiled = profiler.wrap(FakeInventory(FakePage()))
+
+        profiled.get_product_card("Backpack")
+        profiled.get_product_card("Backpack")
+        profiled.get_product_card("Bike Light")
+
+        stats = profiler.stats["FakeInventory.get_product_card"]
+        assert stats.accesses == 3
+        assert len(stats.call_ms) == 3
+        assert stats.match_counts == [2, 2]
+        assert stats.flags(slow_ms=50) == ["MATCHES 2>1"]
+
+    def test_collection_locators_are_not_flagged_for_matches(self, profiler):
+        profiler.wrap(FakeInventory(FakePage())).items
+
+        assert profiler.stats["FakeInventory.items"].flags(slow_ms=50) == []
+
+    def test_components_are_wrapped(self, profiler):
+        header = Header(FakePage(matches={"Swag Labs": 3}))
+        profiled = profiler.wrap(header, "InventoryPage.header")
+
+        profiled.logo
+        assert profiler.stats["InventoryPage.header.logo"].flags(slow_ms=50) == ["MATCHES 3>1"]
+
+    def test_slow_flag_uses_resolution_only(self):
+        stats = SelectorStats(label="Page.card", resolve_ms=[30, 55, 60], actionable_ms=[34])
+
+        assert stats.cost_ms == 55
+        assert stats.flags(slow_ms=50) == ["SLOW"]
+        assert stats.flags(slow_ms=60) == []
+
+    def test_worker_reports_are_merged_and_ranked(self, tmp_path, monkeypatch):
+        for worker_id, resolve_ms in (("gw0", [5.0]), ("gw1", [7.0, 9.0])):
+            monkeypatch.setenv("PYTEST_XDIST_WORKER", worker_id)
+            worker = SelectorProfiler(report_dir=tmp_path)
+            worker.stats["Page.slow"] = SelectorStats(label="Page.slow", accesses=1, resolve_ms=resolve_ms)
+            worker.stats["Page.fast"] = SelectorStats(label="Page.fast", accesses=1, resolve_ms=[1.0])
+            worker.write_report()
+
+        ranked = SelectorProfiler.load_reports(tmp_path)
+
+        assert [stats.label for stats in ranked] == ["Page.slow", "Page.fast"]
+        assert ranked[0].accesses == 2
+        assert ranked[0].resolve_ms == [5.0, 7.0, 9.0]
+        assert ranked[0].cost_ms == 7.0
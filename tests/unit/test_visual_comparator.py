@@ -0,0 +1,109 @@
+import io
+import os
+import pytest
+import numpy as np
+from PIL import Image
+from utilities.visual_comparator import VisualComparator
+
+
+def to_png(pixels: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def baseline_pixels():
+    rng = np.random.default_rng(seed=0)
+    return rng.integers(0, 256, size=(120, 200, 3), dtype=np.uint8)
+
+
+@pytest.fixture
+def comparator(tmp_path, baseline_pixels):
+    """Comparator with a recorded 'page' baseline."""
+    VisualComparator(tmp_path / "baselines", tmp_path / "diffs", update_baselines=True).compare(
+        "page", to_png(baseline_pixels)
+    )
+    return VisualComparator(tmp_path / "baselines", tmp_path / "diffs")
+
+
+@pytest.mark.unit
+class TestVisualComparator:
+    """Test screenshot comparison against baselines on synthetic images."""
+
+    def test_identical_image_passes_by_digest(self, comparator, baseline_pixels):
+        result = comparator.compare("page", to_png(baseline_pixels))
+        assert result.passed
+        assert result.skipped_by == "digest"
+
+    def test_changed_region_fails_with_diff_image(self, comparator, baseline_pixels):
+        actual = baseline_pixels.copy()
+        actual[10:20, 30:40] = 255 - actual[10:20, 30:40]
+
+        result = comparator.compare("page", to_png(actual))
+
+        assert not result.passed
+        assert result.diff_pixels == 100
+        assert result.diff_ratio == pytest.approx(100 / (120 * 200))
+        assert result.diff_path.name == "page-diff.png"
+        assert result.diff_path.exists()
+
+    def test_single_pixel_change_fails_with_default_thresholds(self, comparator, baseline_pixels):
+        actual = baseline_pixels.copy()
+        actual[0, 0] = 255 - actual[0, 0]
+
+        assert not comparator.compare("page", to_png(actual)).passed
+
+    def test_thresholds_can_be_loosened_per_check(self, comparator, baseline_pixels):
+        actual = baseline_pixels.copy()
+        actual[10:20, 30:40] = 255 - actual[10:20, 30:40]
+
+        result = comparator.compare("page", to_png(actual), max_diff_ratio=0.01)
+
+        assert result.passed
+        assert result.diff_pixels == 100
+
+    def test_masked_region_is_ignored(self, comparator, baseline_pixels):
+        actual = baseline_pixels.copy()
+        actual[10:20, 30:40] = 255 - actual[10:20, 30:40]
+
+        result = comparator.compare("page", to_png(actual), mask_regions=[(30, 10, 10, 10)])
+
+        assert result.passed
+        assert result.diff_pixels == 0
+
+    def test_size_mismatch_reports_both_sizes(self, comparator, baseline_pixels):
+        result = comparator.compare("page", to_png(baseline_pixels[:100]))
+
+        assert not result.passed
+        assert "actual 200x100" in result.message
+        assert "baseline 200x120" in result.message
+
+    def test_missing_baseline_fails(self, comparator, baseline_pixels):
+        result = comparator.compare("unknown", to_png(baseline_pixels))
+
+        assert not result.passed
+        assert "--update-baselines" in result.message
+        assert not comparator.has_baseline("unknown")
+
+    def test_stale_index_entry_is_refreshed(self, comparator, baseline_pixels, tmp_path):
+        comparator.save_index()
+        changed = baseline_pixels.copy()
+        changed[0:5, 0:5] = 0
+        baseline_path = comparator.baseline_path("page")
+        baseline_path.write_bytes(to_png(changed))
+        # Make the new file distinguishable even on coarse-mtime filesystems
+        stat = baseline_path.stat()
+        os.utime(baseline_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        fresh = VisualComparator(tmp_path / "baselines", tmp_path / "diffs")
+
+        assert fresh.compare("page", to_png(changed)).skipped_by == "digest"
+        assert not fresh.compare("page", to_png(baseline_pixels)).passed
+
+    def test_no_directories_created_without_writes(self, tmp_path):
+        comparator = VisualComparator(tmp_path / "baselines", tmp_path / "diffs")
+        comparator.save_index()
+
+        assert not (tmp_path / "baselines").exists()
+        assert not (tmp_path / "diffs").exists()
@@ -0,0 +1,259 @@
+import io
+import os
+import json
+import hashlib
+import numpy as np
+from pathlib import Path
+from dataclasses import dataclass
+from PIL import Image
+from playwright.sync_api import Locator, Page
+
+
+@dataclass
+class VisualDiffResult:
+    """Outcome of a single visual comparison."""
+
+    name: str
+    passed: bool
+    diff_ratio: float = 0.0
+    diff_pixels: int = 0
+    skipped_by: str | None = None
+    baseline_created: bool = False
+    diff_path: Path | None = None
+    message: str = ""
+
+
+class BaselineIndex:
+    """
+    Index of baseline fingerprints (byte digest + image size).
+
+    Fingerprints are cached in memory and persisted to index.json next to the baselines,
+    so an unchanged screenshot is recognised by its digest without decoding either image.
+    Entries are invalidated by file mtime/size, so the index is safe to share between runs.
+    """
+
+    INDEX_FILENAME = "index.json"
+
+    def __init__(self, baseline_dir: Path):
+        self._index_path = baseline_dir / self.INDEX_FILENAME
+        self._entries = self._load()
+        self._dirty = False
+
+    def _load(self) -> dict:
+        if not self._index_path.exists():
+            return {}
+        try:
+            with open(self._index_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            # Corrupted index is just a cache miss
+            return {}
+
+    @staticmethod
+    def digest(png_bytes: bytes) -> str:
+        """Exact fingerprint of the encoded image."""
+        return hashlib.blake2b(png_bytes, digest_size=16).hexdigest()
+
+    def get(self, name: str, baseline_path: Path) -> dict:
+        """Get fingerprint for a baseline, computing it only if missing or stale."""
+        stat = baseline_path.stat()
+        entry = self._entries.get(name)
+        if entry and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry
+
+        png_bytes = baseline_path.read_bytes()
+        with Image.open(io.BytesIO(png_bytes)) as image:
+            return self.put(name, baseline_path, png_bytes, image)
+
+    def put(self, name: str, baseline_path: Path, png_bytes: bytes, image: Image.Image) -> dict:
+        """Store fingerprint for a freshly written or re-read baseline."""
+        stat = baseline_path.stat()
+        entry = {
+            "digest": self.digest(png_bytes),
+            "width": image.width,
+            "height": image.height,
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+        }
+        self._entries[name] = entry
+        self._dirty = True
+        return entry
+
+    def save(self):
+        """Persist index atomically (parallel workers may race, last writer wins)."""
+        if not self._dirty:
+            return
+        self._index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._index_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(self._entries, f)
+        os.replace(tmp_path, self._index_path)
+        self._dirty = False
+
+
+class VisualComparator:
+    """
+    Compare screenshots against stored baselines using vectorized NumPy pixel diffs.
+
+    Comparison pipeline (cheapest first):
+        1. Byte digest equal to baseline -> identical, no decode at all
+        2. Size differs from baseline    -> fail without diff
+        3. Full pixel diff with per-pixel tolerance, region masks and max diff ratio
+
+    Defaults are strict (no differing pixels allowed, like Playwright's toHaveScreenshot);
+    loosen them per check via pixel_threshold / max_diff_ratio.
+
+    Args:
+        baseline_dir: Directory holding baseline PNGs (one per check name)
+        diff_dir: Directory for actual/diff images of failed checks
+        update_baselines: Write baselines from actual screenshots instead of comparing
+        pixel_threshold: Max per-channel difference (0-255) for a pixel to count as equal
+        max_diff_ratio: Max fraction of differing pixels for the check to pass
+    """
+
+    def __init__(self, baseline_dir: Path, diff_dir: Path, update_baselines: bool = False,
+                 pixel_threshold: int = 0, max_diff_ratio: float = 0.0):
+        self.baseline_dir = Path(baseline_dir)
+        self.diff_dir = Path(diff_dir)
+        self.update_baselines = update_baselines
+        self.pixel_threshold = pixel_threshold
+        self.max_diff_ratio = max_diff_ratio
+
+        # Directories are created on first write only - runs without visual checks leave no trace
+        self.index = BaselineIndex(self.baseline_dir)
+
+    def baseline_path(self, name: str) -> Path:
+        return self.baseline_dir / f"{name}.png"
+
+    def has_baseline(self, name: str) -> bool:
+        return self.baseline_path(name).exists()
+
+    def compare(self, name: str, png_bytes: bytes, mask_regions: list[tuple[int, int, int, int]] = None,
+                pixel_threshold: int = None, max_diff_ratio: float = None) -> VisualDiffResult:
+        """
+        Compare screenshot bytes against baseline `name`.
+
+        Args:
+            name: Baseline name (file stem, may contain '/' for sub-folders)
+            png_bytes: Actual screenshot as PNG bytes
+            mask_regions: Ignored areas as (x, y, width, height) in screenshot pixels
+            pixel_threshold: Override comparator default for this check
+            max_diff_ratio: Override comparator default for this check
+        """
+        pixel_threshold = self.pixel_threshold if pixel_threshold is None else pixel_threshold
+        max_diff_ratio = self.max_diff_ratio if max_diff_ratio is None else max_diff_ratio
+        baseline_path = self.baseline_path(name)
+
+        if self.update_baselines:
+            self._write_baseline(name, baseline_path, png_bytes)
+            return VisualDiffResult(name=name, passed=True, baseline_created=True)
+
+        if not baseline_path.exists():
+            actual_path = self.diff_dir / f"{name}-actual.png"
+            actual_path.parent.mkdir(parents=True, exist_ok=True)
+            actual_path.write_bytes(png_bytes)
+            return VisualDiffResult(
+                name=name, passed=False, diff_path=actual_path,
+                message=f"Missing visual baseline '{baseline_path}'. Record it with --update-baselines "
+                        f"(actual screenshot saved to {actual_path})",
+            )
+
+        entry = self.index.get(name, baseline_path)
+        if self.index.digest(png_bytes) == entry["digest"]:
+            return VisualDiffResult(name=name, passed=True, skipped_by="digest")
+
+        with Image.open(io.BytesIO(png_bytes)) as image:
+            actual_image = image.convert("RGB")
+
+        actual_size = (actual_image.width, actual_image.height)
+        baseline_size = (entry["width"], entry["height"])
+        if actual_size != baseline_size:
+            actual_path = self._save_failure(name, actual_image)
+            return VisualDiffResult(
+                name=name, passed=False, diff_ratio=1.0, diff_path=actual_path,
+                message=f"Visual size mismatch for '{name}': actual {actual_size[0]}x{actual_size[1]}, "
+                        f"baseline {baseline_size[0]}x{baseline_size[1]}. Actual screenshot: {actual_path}",
+            )
+
+        with Image.open(baseline_path) as image:
+            baseline = np.asarray(image.convert("RGB"))
+        actual = np.asarray(actual_image)
+
+        diff_mask = self._diff_mask(baseline, actual, pixel_threshold, mask_regions)
+        diff_pixels = int(np.count_nonzero(diff_mask))
+        compared_pixels = diff_mask.size - self._masked_pixel_count(diff_mask.shape, mask_regions)
+        diff_ratio = diff_pixels / compared_pixels if compared_pixels else 0.0
+
+        if diff_ratio <= max_diff_ratio:
+            return VisualDiffResult(name=name, passed=True, diff_ratio=diff_ratio, diff_pixels=diff_pixels)
+
+        diff_path = self._save_failure(name, actual_image, actual, diff_mask)
+        return VisualDiffResult(
+            name=name, passed=False, diff_ratio=diff_ratio, diff_pixels=diff_pixels, diff_path=diff_path,
+            message=f"Visual mismatch for '{name}': {diff_ratio:.4%} pixels differ ({diff_pixels} px). "
+                    f"See {diff_path}",
+        )
+
+    @staticmethod
+    def _diff_mask(baseline: np.ndarray, actual: np.ndarray, pixel_threshold: int,
+                   mask_regions: list[tuple[int, int, int, int]] | None) -> np.ndarray:
+        """Boolean HxW array of pixels whose max channel difference exceeds the threshold."""
+        # uint8 abs-diff without upcasting: max(a, b) - min(a, b) never underflows
+        channel_diff = np.maximum(baseline, actual) - np.minimum(baseline, actual)
+        diff_mask = channel_diff.max(axis=2) > pixel_threshold
+        for x, y, width, height in mask_regions or ():
+            diff_mask[max(y, 0):y + height, max(x, 0):x + width] = False
+        return diff_mask
+
+    @staticmethod
+    def _masked_pixel_count(shape: tuple[int, int], mask_regions: list[tuple[int, int, int, int]] | None) -> int:
+        """Number of pixels excluded by masks (overlapping regions counted once)."""
+        if not mask_regions:
+            return 0
+        excluded = np.zeros(shape, dtype=bool)
+        for x, y, width, height in mask_regions:
+            excluded[max(y, 0):y + height, max(x, 0):x + width] = True
+        return int(np.count_nonzero(excluded))
+
+    def _write_baseline(self, name: str, baseline_path: Path, png_bytes: bytes):
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_bytes(png_bytes)
+        with Image.open(io.BytesIO(png_bytes)) as image:
+            self.index.put(name, baseline_path, png_bytes, image)
+
+    def _save_failure(self, name: str, actual_image: Image.Image, actual: np.ndarray = None,
+                      diff_mask: np.ndarray = None) -> Path:
+        """Save actual screenshot and (if sizes match) a red-highlighted diff image."""
+        actual_path = self.diff_dir / f"{name}-actual.png"
+        actual_path.parent.mkdir(parents=True, exist_ok=True)
+        actual_image.save(actual_path)
+        if diff_mask is None:
+            return actual_path
+
+        # Dim the actual screenshot and paint differing pixels red
+        highlighted = (actual // 3).astype(np.uint8)
+        highlighted[diff_mask] = (255, 0, 0)
+        diff_path = self.diff_dir / f"{name}-diff.png"
+        Image.fromarray(highlighted).save(diff_path)
+        return diff_path
+
+    def assert_match(self, target: Page | Locator, name: str, mask: list[Locator] = None,
+                     mask_regions: list[tuple[int, int, int, int]] = None, **thresholds):
+        """
+        Take a screenshot of a page or locator and assert it matches baseline `name`.
+
+        Args:
+            target: Playwright Page (viewport) or Locator (element only)
+            name: Baseline name
+            mask: Locators to cover before screenshot (dynamic content like prices or badges)
+            mask_regions: Extra ignored areas as (x, y, width, height)
+            **thresholds: pixel_threshold / max_diff_ratio overrides
+        """
+        png_bytes = target.screenshot(animations="disabled", caret="hide", mask=mask or [])
+        result = self.compare(name, png_bytes, mask_regions=mask_regions, **thresholds)
+        assert result.passed, result.message
+        return result
+
+    def save_index(self):
+        """Persist baseline index (call once at session end)."""
+        self.index.save()